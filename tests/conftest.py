@@ -1,18 +1,28 @@
 import json
+import typing as t
 from pathlib import Path
 
 import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from faker import Faker
+from google.oauth2 import service_account
 
+from async_firebase.client import AsyncFirebaseClient
 
-@pytest.fixture()
+
+# Credentials built from a fake service account, keyed by ``private_key_id``.
+_CREDS_CACHE: t.Dict[str, service_account.Credentials] = {}
+
+
+@pytest.fixture(scope="session")
 def faker_():
-    return Faker()
+    faker = Faker()
+    faker.seed_instance(0)
+    return faker
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def fake_service_account(faker_):
     project_id = f"fake-mobile-app"
     client_email = f"firebase-adminsdk-h18o4@{project_id}.iam.gserviceaccount.com"
@@ -43,3 +53,37 @@ def fake_service_account_file(fake_service_account, faker_):
         json.dump(fake_service_account, outfile)
     yield file_name
     file_name.unlink()
+
+
+@pytest.fixture()
+def fake_async_fcm_client():
+    return AsyncFirebaseClient()
+
+
+@pytest.fixture(scope="module")
+def _fake_async_fcm_client_w_creds(fake_service_account):
+    private_key_id = fake_service_account["private_key_id"]
+    if private_key_id not in _CREDS_CACHE:
+        _CREDS_CACHE[private_key_id] = service_account.Credentials.from_service_account_info(
+            info=fake_service_account, scopes=AsyncFirebaseClient.SCOPES
+        )
+    return AsyncFirebaseClient(credentials=_CREDS_CACHE[private_key_id])
+
+
+@pytest.fixture()
+def fake_async_fcm_client_w_creds(_fake_async_fcm_client_w_creds):
+    """
+    Module-scoped client with credentials, restored to its initial state after every test.
+
+    Building credentials parses the RSA private key, so the client is built once per module. Tests are free to
+    override attributes of the client, those overrides are rolled back on teardown. The underlying HTTP client is
+    kept, so all tests in a module share one ``httpx.AsyncClient``.
+    """
+    client = _fake_async_fcm_client_w_creds
+    client._credentials.token = None
+    client._credentials.expiry = None
+    initial_state = vars(client).copy()
+    yield client
+    http_client = client._http_client
+    vars(client).clear()
+    vars(client).update(initial_state, _http_client=http_client)
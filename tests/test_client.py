@@ -1,14 +1,14 @@
+import asyncio
 import json
 import uuid
-from datetime import datetime
-from unittest import mock
+from datetime import datetime, timedelta, timezone
+from importlib.metadata import version
 
-import pkg_resources
+import httpx
 import pytest
 from google.oauth2 import service_account
 from pytest_httpx import HTTPXMock
 
-from async_firebase.client import AsyncFirebaseClient
 from async_firebase.errors import InternalError
 from async_firebase.messages import (
     AndroidConfig,
@@ -32,156 +32,256 @@ from async_firebase.utils import FcmErrorCode
 
 pytestmark = pytest.mark.asyncio
 
+FAKE_ACCESS_TOKEN_EXPIRY = datetime.utcnow() + timedelta(days=30)
 
-@pytest.fixture()
-def fake_async_fcm_client():
-    return AsyncFirebaseClient()
-
-
-@pytest.fixture()
-def fake_async_fcm_client_w_creds(fake_async_fcm_client, fake_service_account):
-    client = AsyncFirebaseClient()
-    client.creds_from_service_account_info(fake_service_account)
-    return client
-
+# Static responses are built once, at import time, and handed out by ``httpx_mock`` callbacks.
+FCM_SEND_RESPONSE = httpx.Response(
+    200, json={"name": "projects/fake-mobile-app/messages/0:1612788010922733%7606eb247606eb24"}
+)
+FCM_SEND_DRY_RUN_RESPONSE = httpx.Response(200, json={"name": "projects/fake-mobile-app/messages/fake_message_id"})
+FCM_UNAUTHENTICATED_ERROR = {
+    "error": {
+        "code": 401,
+        "message": "Request had invalid authentication credentials. "
+        "Expected OAuth 2 access token, login cookie or other "
+        "valid authentication credential. See "
+        "https://developers.google.com/identity/sign-in/web/devconsole-project.",
+        "status": "UNAUTHENTICATED",
+    }
+}
+FCM_UNAUTHENTICATED_RESPONSE = httpx.Response(401, json=FCM_UNAUTHENTICATED_ERROR)
+TOPIC_MANAGEMENT_RESPONSE = httpx.Response(200, json={"results": [{}, {}, {}]})
+TOPIC_MANAGEMENT_INVALID_ARGUMENT_RESPONSE = httpx.Response(
+    200, json={"results": [{}, {}, {}, {"error": "INVALID_ARGUMENT"}]}
+)
 
-@pytest.fixture()
+# Expected values are built once, at import time. APNS headers assume ``FrozenDatetime`` and the default TTL.
+FROZEN_UUID = uuid.UUID(hex="6eadf1d38633427cb83dbb9be137f48c")
+EXP_HEADERS = {
+    "Authorization": "Bearer fake-jwt-token",
+    "Content-Type": "application/json; UTF-8",
+    "X-Request-Id": str(FROZEN_UUID),
+    "X-GOOG-API-FORMAT-VERSION": "2",
+    "X-FIREBASE-CLIENT": "async-firebase/{0}".format(version("async-firebase")),
+}
+EXP_BUCKET_UPDATED_APNS_HEADERS = {
+    "apns-expiration": "1613390410",
+    "apns-priority": "5",
+    "apns-topic": "Your bucket has been updated",
+    "apns-collapse-id": "BUCKET_UPDATED",
+}
+EXP_BUCKET_UPDATED_APS = {
+    "badge": 1,
+    "category": "CATEGORY_BUCKET_UPDATED",
+    "content-available": True,
+    "mutable-content": True,
+}
+EXP_REALISTIC_APNS = {
+    "headers": EXP_BUCKET_UPDATED_APNS_HEADERS,
+    "payload": {
+        "aps": EXP_BUCKET_UPDATED_APS,
+        "bucket_name": "3bc56ff12a",
+        "bucket_link": "/link/to/bucket/3bc56ff12a",
+        "aliases": ["happy_friends", "mobile_groups"],
+        "updated_count": 1,
+    },
+}
+EXP_SEND_EACH_APNS = {
+    "headers": EXP_BUCKET_UPDATED_APNS_HEADERS,
+    "payload": {"aps": EXP_BUCKET_UPDATED_APS, "foo": "bar"},
+}
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
 def fake_device_token(faker_):
     return faker_.bothify(text=f"{'?' * 12}:{'?' * 256}")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def fake_multi_device_tokens(faker_, request):
     return [faker_.bothify(text=f"{'?' * 12}:{'?' * 256}") for _ in range(request.param)]
 
 
-async def fake__get_access_token():
-    return "fake-jwt-token"
+class FrozenDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        # timezone-aware, so ``timestamp()`` does not depend on the local time zone
+        return cls(2021, 2, 8, 12, 0, 10, tzinfo=timezone.utc)
 
 
-def test_build_android_config(fake_async_fcm_client_w_creds):
-    android_config = fake_async_fcm_client_w_creds.build_android_config(
-        priority="high",
-        ttl=7200,
-        collapse_key="something",
-        restricted_package_name="some-package",
-        data={"key_1": "value_1", "key_2": 100, "foo": None},
-        color="red",
-        sound="beep",
-        tag="test",
-        click_action="TOP_STORY_ACTIVITY",
-        channel_id="some_channel_id",
-        notification_count=7,
-    )
-    assert android_config == AndroidConfig(
-        **{
-            "priority": "high",
-            "collapse_key": "something",
-            "restricted_package_name": "some-package",
-            "data": {"key_1": "value_1", "key_2": "100", "foo": "null"},
-            "ttl": "7200s",
-            "notification": AndroidNotification(
+@pytest.fixture(autouse=True)
+def fake_access_token(fake_async_fcm_client_w_creds):
+    fake_async_fcm_client_w_creds._credentials.token = "fake-jwt-token"
+    fake_async_fcm_client_w_creds._credentials.expiry = FAKE_ACCESS_TOKEN_EXPIRY
+
+
+@pytest.mark.parametrize(
+    "builder, kwargs, exp_config",
+    (
+        (
+            "build_android_config",
+            {
+                "priority": "high",
+                "ttl": 7200,
+                "collapse_key": "something",
+                "restricted_package_name": "some-package",
+                "data": {"key_1": "value_1", "key_2": 100, "foo": None},
+                "color": "red",
+                "sound": "beep",
+                "tag": "test",
+                "click_action": "TOP_STORY_ACTIVITY",
+                "channel_id": "some_channel_id",
+                "notification_count": 7,
+            },
+            AndroidConfig(
                 **{
-                    "color": "red",
-                    "sound": "beep",
-                    "tag": "test",
-                    "click_action": "TOP_STORY_ACTIVITY",
-                    "title": None,
-                    "body": None,
-                    "icon": None,
-                    "body_loc_key": None,
-                    "body_loc_args": [],
-                    "title_loc_key": None,
-                    "title_loc_args": [],
-                    "channel_id": "some_channel_id",
-                    "notification_count": 7,
+                    "priority": "high",
+                    "collapse_key": "something",
+                    "restricted_package_name": "some-package",
+                    "data": {"key_1": "value_1", "key_2": "100", "foo": "null"},
+                    "ttl": "7200s",
+                    "notification": AndroidNotification(
+                        **{
+                            "color": "red",
+                            "sound": "beep",
+                            "tag": "test",
+                            "click_action": "TOP_STORY_ACTIVITY",
+                            "title": None,
+                            "body": None,
+                            "icon": None,
+                            "body_loc_key": None,
+                            "body_loc_args": [],
+                            "title_loc_key": None,
+                            "title_loc_args": [],
+                            "channel_id": "some_channel_id",
+                            "notification_count": 7,
+                        }
+                    ),
                 }
             ),
-        }
-    )
-
-
-def test_build_apns_config(fake_async_fcm_client_w_creds, freezer):
-    apns_message = fake_async_fcm_client_w_creds.build_apns_config(
-        priority="high",
-        ttl=7200,
-        apns_topic="test-topic",
-        collapse_key="something",
-        alert="alert-message",
-        title="some-title",
-        badge=0,
-    )
-    assert apns_message == APNSConfig(
-        **{
-            "headers": {
-                "apns-expiration": str(int(datetime.utcnow().timestamp()) + 7200),
-                "apns-priority": "10",
-                "apns-topic": "test-topic",
-                "apns-collapse-id": "something",
+        ),
+        (
+            "build_apns_config",
+            {
+                "priority": "high",
+                "ttl": 7200,
+                "apns_topic": "test-topic",
+                "collapse_key": "something",
+                "alert": "alert-message",
+                "title": "some-title",
+                "badge": 0,
             },
-            "payload": APNSPayload(
+            APNSConfig(
                 **{
-                    "aps": Aps(
+                    "headers": {
+                        "apns-expiration": "1612792810",
+                        "apns-priority": "10",
+                        "apns-topic": "test-topic",
+                        "apns-collapse-id": "something",
+                    },
+                    "payload": APNSPayload(
                         **{
-                            "alert": ApsAlert(title="some-title", body="alert-message"),
-                            "badge": 0,
-                            "sound": "default",
-                            "content_available": None,
-                            "category": None,
-                            "thread_id": None,
-                            "mutable_content": True,
-                            "custom_data": {},
+                            "aps": Aps(
+                                **{
+                                    "alert": ApsAlert(title="some-title", body="alert-message"),
+                                    "badge": 0,
+                                    "sound": "default",
+                                    "content_available": None,
+                                    "category": None,
+                                    "thread_id": None,
+                                    "mutable_content": True,
+                                    "custom_data": {},
+                                }
+                            )
                         }
-                    )
+                    ),
                 }
             ),
-        }
-    )
+        ),
+        (
+            "build_webpush_config",
+            {
+                "data": {"attr_1": "value_1", "attr_2": "value_2"},
+                "title": "Test Webpush Title",
+                "body": "Test Webpush Body",
+                "image": "https://cdn.healhtjoy.com/public/test-image.png",
+                "language": "en",
+                "tag": "test",
+                "custom_data": {"attr_3": "value_3", "attr_4": "value_4"},
+                "link": "https://link-to-something.domain.com",
+            },
+            WebpushConfig(
+                data={"attr_1": "value_1", "attr_2": "value_2"},
+                headers={},
+                notification=WebpushNotification(
+                    title="Test Webpush Title",
+                    body="Test Webpush Body",
+                    image="https://cdn.healhtjoy.com/public/test-image.png",
+                    language="en",
+                    tag="test",
+                    silent=False,
+                    renotify=False,
+                    actions=[],
+                    direction="auto",
+                    custom_data={"attr_3": "value_3", "attr_4": "value_4"},
+                ),
+                fcm_options=WebpushFCMOptions(link="https://link-to-something.domain.com"),
+            ),
+        ),
+    ),
+)
+def test_build_config(fake_async_fcm_client_w_creds, monkeypatch, builder, kwargs, exp_config):
+    monkeypatch.setattr("async_firebase.client.datetime", FrozenDatetime)
+    config = getattr(fake_async_fcm_client_w_creds, builder)(**kwargs)
+    assert config == exp_config
 
 
-async def test_prepare_headers(fake_async_fcm_client_w_creds):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    frozen_uuid = uuid.UUID(hex="6eadf1d38633427cb83dbb9be137f48c")
-    fake_async_fcm_client_w_creds.get_request_id = lambda: str(frozen_uuid)
+async def test_prepare_headers(fake_async_fcm_client_w_creds, monkeypatch):
+    monkeypatch.setattr(uuid, "uuid4", lambda: FROZEN_UUID)
     headers = await fake_async_fcm_client_w_creds.prepare_headers()
-    assert headers == {
-        "Authorization": "Bearer fake-jwt-token",
-        "Content-Type": "application/json; UTF-8",
-        "X-Request-Id": str(frozen_uuid),
-        "X-GOOG-API-FORMAT-VERSION": "2",
-        "X-FIREBASE-CLIENT": "async-firebase/{0}".format(pkg_resources.get_distribution("async-firebase").version),
-    }
-
-
-async def test_push(fake_async_fcm_client_w_creds, fake_device_token, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    creds = fake_async_fcm_client_w_creds._credentials
-    httpx_mock.add_response(
-        status_code=200,
-        json={"name": f"projects/{creds.project_id}/messages/0:1612788010922733%7606eb247606eb24"},
-    )
-    apns_config = fake_async_fcm_client_w_creds.build_apns_config(
-        priority="normal",
-        apns_topic="test-push",
-        collapse_key="push",
-        badge=0,
-        category="test-category",
-        custom_data={"foo": "bar"},
-    )
-    message = Message(apns=apns_config, token=fake_device_token)
-    response = await fake_async_fcm_client_w_creds.send(message)
-    assert isinstance(response, FCMResponse)
-    assert response.success
-    assert response.message_id == "projects/fake-mobile-app/messages/0:1612788010922733%7606eb247606eb24"
+    assert headers == EXP_HEADERS
 
 
-async def test_send_dry_run(fake_async_fcm_client_w_creds, fake_device_token, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    creds = fake_async_fcm_client_w_creds._credentials
-    httpx_mock.add_response(
-        status_code=200,
-        json={"name": f"projects/{creds.project_id}/messages/fake_message_id"},
-    )
+@pytest.mark.parametrize(
+    "response, dry_run, exp_message_id, exp_error_code",
+    (
+        (
+            FCM_SEND_RESPONSE,
+            False,
+            "projects/fake-mobile-app/messages/0:1612788010922733%7606eb247606eb24",
+            None,
+        ),
+        (
+            FCM_SEND_DRY_RUN_RESPONSE,
+            True,
+            "projects/fake-mobile-app/messages/fake_message_id",
+            None,
+        ),
+        (
+            FCM_UNAUTHENTICATED_RESPONSE,
+            False,
+            None,
+            FcmErrorCode.UNAUTHENTICATED.value,
+        ),
+    ),
+)
+async def test_send(
+    fake_async_fcm_client_w_creds,
+    fake_device_token,
+    httpx_mock: HTTPXMock,
+    response,
+    dry_run,
+    exp_message_id,
+    exp_error_code,
+):
+    httpx_mock.add_callback(lambda request: response)
     apns_config = fake_async_fcm_client_w_creds.build_apns_config(
         priority="normal",
         apns_topic="test-push",
@@ -191,43 +291,17 @@ async def test_send_dry_run(fake_async_fcm_client_w_creds, fake_device_token, ht
         custom_data={"foo": "bar"},
     )
     message = Message(apns=apns_config, token=fake_device_token)
-    response = await fake_async_fcm_client_w_creds.send(message, dry_run=True)
-    assert isinstance(response, FCMResponse)
-    assert response.success
-    assert response.message_id == "projects/fake-mobile-app/messages/fake_message_id"
-
-
-async def test_send_unauthenticated(fake_async_fcm_client_w_creds, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    httpx_mock.add_response(
-        status_code=401,
-        json={
-            "error": {
-                "code": 401,
-                "message": "Request had invalid authentication credentials. "
-                "Expected OAuth 2 access token, login cookie or other "
-                "valid authentication credential. See "
-                "https://developers.google.com/identity/sign-in/web/devconsole-project.",
-                "status": "UNAUTHENTICATED",
-            }
-        },
-    )
-    apns_config = fake_async_fcm_client_w_creds.build_apns_config(
-        priority="normal",
-        apns_topic="test-push",
-        collapse_key="push",
-        badge=0,
-        category="test-category",
-        custom_data={"foo": "bar"},
-    )
-    message = Message(apns=apns_config, token="qwerty:ytrewq")
-    fcm_response = await fake_async_fcm_client_w_creds.send(message)
+    fcm_response = await fake_async_fcm_client_w_creds.send(message, dry_run=dry_run)
 
+    assert json.loads(httpx_mock.get_requests()[0].read())["validate_only"] is dry_run
     assert isinstance(fcm_response, FCMResponse)
-    assert not fcm_response.success
-    assert fcm_response.exception is not None
-    assert fcm_response.exception.code == FcmErrorCode.UNAUTHENTICATED.value
-    assert fcm_response.exception.cause.response.status_code == 401
+    assert fcm_response.success is (exp_error_code is None)
+    assert fcm_response.message_id == exp_message_id
+    if exp_error_code is None:
+        assert fcm_response.exception is None
+    else:
+        assert fcm_response.exception.code == exp_error_code
+        assert fcm_response.exception.cause.response.status_code == response.status_code
 
 
 async def test_send_data_has_not_been_provided(fake_async_fcm_client_w_creds):
@@ -246,13 +320,11 @@ def test_creds_from_service_account_file(fake_async_fcm_client, fake_service_acc
     assert isinstance(fake_async_fcm_client._credentials, service_account.Credentials)
 
 
-async def test_send_realistic_payload(fake_async_fcm_client_w_creds, fake_device_token, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    creds = fake_async_fcm_client_w_creds._credentials
-    httpx_mock.add_response(
-        status_code=200,
-        json={"name": f"projects/{creds.project_id}/messages/0:1612788010922733%7606eb247606eb24"},
-    )
+async def test_send_realistic_payload(
+    fake_async_fcm_client_w_creds, fake_device_token, httpx_mock: HTTPXMock, monkeypatch
+):
+    monkeypatch.setattr("async_firebase.client.datetime", FrozenDatetime)
+    httpx_mock.add_callback(lambda request: FCM_SEND_RESPONSE)
     apns_config: APNSConfig = fake_async_fcm_client_w_creds.build_apns_config(
         priority="normal",
         apns_topic="Your bucket has been updated",
@@ -272,31 +344,13 @@ async def test_send_realistic_payload(fake_async_fcm_client_w_creds, fake_device
     await fake_async_fcm_client_w_creds.send(message)
     request_payload = json.loads(httpx_mock.get_requests()[0].read())
     assert request_payload == {
-        "message": {
-            "apns": {
-                "headers": apns_config.headers,
-                "payload": {
-                    "aps": {
-                        "badge": 1,
-                        "category": "CATEGORY_BUCKET_UPDATED",
-                        "content-available": True,
-                        "mutable-content": True,
-                    },
-                    "bucket_name": "3bc56ff12a",
-                    "bucket_link": "/link/to/bucket/3bc56ff12a",
-                    "aliases": ["happy_friends", "mobile_groups"],
-                    "updated_count": 1,
-                },
-            },
-            "token": fake_device_token,
-        },
+        "message": {"apns": EXP_REALISTIC_APNS, "token": fake_device_token},
         "validate_only": False,
     }
 
 
 @pytest.mark.parametrize("fake_multi_device_tokens", (3,), indirect=True)
 async def test_send_all(fake_async_fcm_client_w_creds, fake_multi_device_tokens: list, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
     creds = fake_async_fcm_client_w_creds._credentials
     response_data = (
         "\r\n--batch_llG_9dniIyeFXPERplIRPwpVYtn3RBa4\r\nContent-Type: application/http\r\nContent-ID: "
@@ -341,11 +395,9 @@ async def test_send_all(fake_async_fcm_client_w_creds, fake_multi_device_tokens:
 
 @pytest.mark.parametrize("fake_multi_device_tokens", (3,), indirect=True)
 async def test_send_each_makes_proper_http_calls(
-    fake_async_fcm_client_w_creds, fake_multi_device_tokens: list, httpx_mock: HTTPXMock
+    fake_async_fcm_client_w_creds, fake_multi_device_tokens: list, httpx_mock: HTTPXMock, monkeypatch
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    creds = fake_async_fcm_client_w_creds._credentials
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
+    monkeypatch.setattr("async_firebase.client.datetime", FrozenDatetime)
     creds = fake_async_fcm_client_w_creds._credentials
     response_message_ids = [
         "0:1612788010922733%7606eb247606eb24",
@@ -373,24 +425,8 @@ async def test_send_each_makes_proper_http_calls(
     await fake_async_fcm_client_w_creds.send_each(messages)
     request_payloads = [json.loads(request.read()) for request in httpx_mock.get_requests()]
     expected_request_payloads = [
-        {
-            "message": {
-                "apns": {
-                    "headers": apns_config.headers,
-                    "payload": {
-                        "aps": {
-                            "badge": 1,
-                            "category": "CATEGORY_BUCKET_UPDATED",
-                            "content-available": True,
-                            "mutable-content": True,
-                        },
-                        "foo": "bar",
-                    },
-                },
-                "token": fake_device_token,
-            },
-            "validate_only": False,
-        } for fake_device_token in fake_multi_device_tokens
+        {"message": {"apns": EXP_SEND_EACH_APNS, "token": fake_device_token}, "validate_only": False}
+        for fake_device_token in fake_multi_device_tokens
     ]
     for payload, expected_payload in zip(request_payloads, expected_request_payloads):
         assert payload == expected_payload
@@ -400,9 +436,6 @@ async def test_send_each_makes_proper_http_calls(
 async def test_send_each_returns_correct_data(
     fake_async_fcm_client_w_creds, fake_multi_device_tokens: list, httpx_mock: HTTPXMock
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    creds = fake_async_fcm_client_w_creds._credentials
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
     creds = fake_async_fcm_client_w_creds._credentials
     response_message_ids = [
         "0:1612788010922733%7606eb247606eb24",
@@ -451,9 +484,12 @@ async def test_send_each_returns_correct_data(
 async def test_send_each_for_multicast(
     fake_async_fcm_client_w_creds, fake_multi_device_tokens: list,
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    send_each_mock = mock.AsyncMock()
-    fake_async_fcm_client_w_creds.send_each = send_each_mock
+    send_each_calls = []
+
+    async def fake_send_each(messages, *, dry_run=False):
+        send_each_calls.append((messages, dry_run))
+
+    fake_async_fcm_client_w_creds.send_each = fake_send_each
     apns_config = fake_async_fcm_client_w_creds.build_apns_config(
         priority="normal",
         apns_topic="test-push",
@@ -465,7 +501,9 @@ async def test_send_each_for_multicast(
     await fake_async_fcm_client_w_creds.send_each_for_multicast(
         MulticastMessage(apns=apns_config, tokens=fake_multi_device_tokens),
     )
-    send_each_argument = send_each_mock.call_args[0][0]
+    assert len(send_each_calls) == 1
+    send_each_argument, dry_run = send_each_calls[0]
+    assert dry_run is False
     assert isinstance(send_each_argument, list)
     for message in send_each_argument:
         assert isinstance(message, Message)
@@ -477,7 +515,6 @@ async def test_send_each_for_multicast(
 async def test_send_all_dry_run(
     fake_async_fcm_client_w_creds, fake_multi_device_tokens: list, httpx_mock: HTTPXMock
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
     creds = fake_async_fcm_client_w_creds._credentials
     response_data = (
         "\r\n--batch_llG_9dniIyeFXPERplIRPwpVYtn3RBa4\r\nContent-Type: application/http\r\nContent-ID: "
@@ -525,7 +562,6 @@ async def test_send_multicast_too_many_tokens(
     fake_async_fcm_client_w_creds,
     fake_multi_device_tokens: list,
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
     apns_config = fake_async_fcm_client_w_creds.build_apns_config(
         priority="normal",
         apns_topic="test-push",
@@ -542,7 +578,6 @@ async def test_send_multicast_too_many_tokens(
 
 
 async def test_send_all_unknown_registration_token(fake_async_fcm_client_w_creds, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
     response_data = (
         "\r\n--batch_HwFDZe-SUCq5qEgCavJPhhi8tA7xJBlB\r\nContent-Type: application/http\r\nContent-ID: "
         "response-363ad2c9-a3d1-45f5-b559-6d69a13a880e\r\n\r\nHTTP/1.1 400 Bad Request\r\nVary: Origin\r\nVary: "
@@ -576,7 +611,6 @@ async def test_send_all_unknown_registration_token(fake_async_fcm_client_w_creds
 
 
 async def test_send_response_error_invalid_argument(fake_async_fcm_client_w_creds, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
     response_data = (
         '\r\n--batch_H3WKviwlw1OiFBuquMNPomHJtcBwS2Oi\r\n'
         'Content-Type: application/http\r\n'
@@ -626,7 +660,6 @@ async def test_send_all_too_many_messages(
     fake_async_fcm_client_w_creds,
     fake_multi_device_tokens: list,
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
     apns_config = fake_async_fcm_client_w_creds.build_apns_config(
         priority="normal",
         apns_topic="test-push",
@@ -709,43 +742,9 @@ def test_assemble_push_notification(fake_async_fcm_client_w_creds, apns_config,
     assert push_notification == exp_push_notification
 
 
-def test_build_webpush_config(fake_async_fcm_client_w_creds):
-    webpush_config = fake_async_fcm_client_w_creds.build_webpush_config(
-        data={"attr_1": "value_1", "attr_2": "value_2"},
-        title="Test Webpush Title",
-        body="Test Webpush Body",
-        image="https://cdn.healhtjoy.com/public/test-image.png",
-        language="en",
-        tag="test",
-        custom_data={"attr_3": "value_3", "attr_4": "value_4"},
-        link="https://link-to-something.domain.com"
-    )
-    assert webpush_config == WebpushConfig(
-        data={"attr_1": "value_1", "attr_2": "value_2"},
-        headers={},
-        notification=WebpushNotification(
-            title="Test Webpush Title",
-            body="Test Webpush Body",
-            image="https://cdn.healhtjoy.com/public/test-image.png",
-            language="en",
-            tag="test",
-            silent=False,
-            renotify=False,
-            actions=[],
-            direction="auto",
-            custom_data={"attr_3": "value_3", "attr_4": "value_4"},
-        ),
-        fcm_options=WebpushFCMOptions(link="https://link-to-something.domain.com")
-    )
-
-
 @pytest.mark.parametrize("fake_multi_device_tokens", (3,), indirect=True)
 async def test_subscribe_to_topic(fake_async_fcm_client_w_creds, fake_multi_device_tokens, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    httpx_mock.add_response(
-        status_code=200,
-        json={"results": [{}, {}, {}]},
-    )
+    httpx_mock.add_callback(lambda request: TOPIC_MANAGEMENT_RESPONSE)
     response = await fake_async_fcm_client_w_creds.subscribe_devices_to_topic(
         topic_name="test_topic", device_tokens=fake_multi_device_tokens
     )
@@ -759,13 +758,9 @@ async def test_subscribe_to_topic(fake_async_fcm_client_w_creds, fake_multi_devi
 async def test_subscribe_to_topic_with_incorrect(
         fake_async_fcm_client_w_creds, fake_multi_device_tokens, httpx_mock: HTTPXMock
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
 
     device_tokens = [*fake_multi_device_tokens, "incorrect"]
-    httpx_mock.add_response(
-        status_code=200,
-        json={"results": [{}, {}, {}, {"error": "INVALID_ARGUMENT"}]},
-    )
+    httpx_mock.add_callback(lambda request: TOPIC_MANAGEMENT_INVALID_ARGUMENT_RESPONSE)
     response = await fake_async_fcm_client_w_creds.subscribe_devices_to_topic(
         topic_name='test_topic', device_tokens=device_tokens
     )
@@ -781,11 +776,7 @@ async def test_subscribe_to_topic_with_incorrect(
 
 @pytest.mark.parametrize("fake_multi_device_tokens", (3,), indirect=True)
 async def test_unsubscribe_to_topic(fake_async_fcm_client_w_creds, fake_multi_device_tokens, httpx_mock: HTTPXMock):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    httpx_mock.add_response(
-        status_code=200,
-        json={"results": [{}, {}, {}]},
-    )
+    httpx_mock.add_callback(lambda request: TOPIC_MANAGEMENT_RESPONSE)
     response = await fake_async_fcm_client_w_creds.unsubscribe_devices_from_topic(
         topic_name="test_topic", device_tokens=fake_multi_device_tokens
     )
@@ -799,13 +790,9 @@ async def test_unsubscribe_to_topic(fake_async_fcm_client_w_creds, fake_multi_de
 async def test_unsubscribe_to_topic_with_incorrect(
         fake_async_fcm_client_w_creds, fake_multi_device_tokens, httpx_mock: HTTPXMock
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
 
     device_tokens = [*fake_multi_device_tokens, "incorrect"]
-    httpx_mock.add_response(
-        status_code=200,
-        json={"results": [{}, {}, {}, {"error": "INVALID_ARGUMENT"}]},
-    )
+    httpx_mock.add_callback(lambda request: TOPIC_MANAGEMENT_INVALID_ARGUMENT_RESPONSE)
     response = await fake_async_fcm_client_w_creds.unsubscribe_devices_from_topic(
         topic_name='test_topic', device_tokens=device_tokens
     )
@@ -823,20 +810,7 @@ async def test_unsubscribe_to_topic_with_incorrect(
 async def test_send_topic_management_unauthenticated(
     fake_async_fcm_client_w_creds, fake_multi_device_tokens, httpx_mock: HTTPXMock
 ):
-    fake_async_fcm_client_w_creds._get_access_token = fake__get_access_token
-    httpx_mock.add_response(
-        status_code=401,
-        json={
-            "error": {
-                "code": 401,
-                "message": "Request had invalid authentication credentials. "
-                "Expected OAuth 2 access token, login cookie or other "
-                "valid authentication credential. See "
-                "https://developers.google.com/identity/sign-in/web/devconsole-project.",
-                "status": "UNAUTHENTICATED",
-            }
-        },
-    )
+    httpx_mock.add_callback(lambda request: FCM_UNAUTHENTICATED_RESPONSE)
     response = await fake_async_fcm_client_w_creds.unsubscribe_devices_from_topic(
         topic_name="test_topic", device_tokens=fake_multi_device_tokens
     )
@@ -846,3 +820,4 @@ async def test_send_topic_management_unauthenticated(
     assert response.exception is not None
     assert response.exception.code == FcmErrorCode.UNAUTHENTICATED.value
     assert response.exception.cause.response.status_code == 401
+    assert response.exception.cause.response.json() == FCM_UNAUTHENTICATED_ERROR